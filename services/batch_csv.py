@@ -1,15 +1,71 @@
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import pandas as pd
 
 
-def batch_csv_read(file_paths:list):
+def _read_csv(path, engine, use_cache=False, use_arrow_dtypes=False):
+    """ Reads a single CSV with the requested backend, falling back to pandas' default
+    parser if the faster engine cannot handle the file (e.g. unusual quoting).
+    With use_cache, parses the CSV once and keeps a .parquet copy next to it for much
+    faster reloads; the cache is ignored whenever the CSV is newer than it.
+    With use_arrow_dtypes, columns stay Arrow-backed (pd.ArrowDtype) end to end - no copy
+    into numpy arrays and roughly half the memory for string-heavy files."""
+    if use_cache:
+        cache = path + '.parquet'
+        if os.path.exists(cache) and os.path.getmtime(cache) >= os.path.getmtime(path):
+            if use_arrow_dtypes:
+                return pd.read_parquet(cache, engine='pyarrow', dtype_backend='pyarrow')
+            return pd.read_parquet(cache, engine='pyarrow')
+        df = _read_csv(path, engine, use_arrow_dtypes=use_arrow_dtypes)
+        #cache write is best effort, e.g. the data folder may be read only
+        try:
+            df.to_parquet(cache, compression='zstd')
+        except Exception:
+            pass
+        return df
+    if use_arrow_dtypes:
+        import pyarrow.csv as pa_csv
+        #multithreaded block parsing straight into an Arrow table, wrapped zero-copy
+        table = pa_csv.read_csv(path, read_options=pa_csv.ReadOptions(use_threads=True, block_size=8 << 20))
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    if engine == 'polars':
+        import polars as pl
+        return pl.read_csv(path).to_pandas()
+    if engine == 'pyarrow':
+        #pyarrow's block parser is multithreaded but stricter than the default engine
+        try:
+            return pd.read_csv(path, engine='pyarrow')
+        except Exception:
+            return pd.read_csv(path)
+    return pd.read_csv(path)
+
+
+def batch_csv_read(file_paths:list, parallel=True, engine:str = 'pyarrow', lowercase_cols:bool = False,
+                   use_cache:bool = True, use_arrow_dtypes:bool = False):
     """ Function to read all CSVs and place into a dictionary of dataframes for subsequent analysis and joining.
     File paths should be from the parent folder onwards. Do not include C:/User etc.
-    
+    Files are read concurrently across a thread pool by default, so many medium sized CSVs load in
+    roughly the time of the slowest file rather than the sum of all of them.
+
     Parameters:
     -----------
         file_paths (list): A list of file paths, each string should look like '/data/stored/here/mydata.csv'.
-        
+        parallel (bool or int): If True, reads files across one thread per file up to the CPU count.
+            An int sets the worker count explicitly. False reads files one at a time. Defaults to True.
+        engine (str): CSV parser backend - 'pyarrow' (multithreaded, default), 'polars' (requires the
+            polars package) or 'pandas' for the standard single threaded parser. The pyarrow engine
+            falls back to pandas per file if it cannot parse it.
+        lowercase_cols (bool): If True, forces every column name to lower case after loading.
+            Source data can have irregular capitalisation such as 'Geography Code' vs 'geography code'
+            which breaks joins later on. Defaults to False.
+        use_cache (bool): If True, saves a .parquet copy alongside each CSV on first read and loads
+            that on later calls - an order of magnitude faster for repeated notebook runs. Editing
+            the CSV invalidates its cache automatically. Defaults to True.
+        use_arrow_dtypes (bool): If True, keeps columns Arrow-backed (pd.ArrowDtype) rather than
+            copying into numpy arrays - around half the memory for string-heavy files and well
+            suited to multi-GB CSVs. Overrides the engine choice. Defaults to False.
+
     Example:
     --------
     >>> # Define file paths – relative path for each csv
@@ -20,13 +76,37 @@ def batch_csv_read(file_paths:list):
     >>> ]
     >>> load all defined csvs
     >>> loaded_csv = batch_csv.batch_csv_read(file_paths)
-    
+
     """
     base_dir = os.getcwd()
     csv_loaded = {}
+    #key for each dataframe is the file name without its extension
+    keys = {}
     for file_path in file_paths:
         filename = os.path.basename(file_path)
-        key = os.path.splitext(filename)[0]
-        csv_loaded[key] = pd.read_csv(base_dir+file_path)
+        keys[file_path] = os.path.splitext(filename)[0]
+
+    #work out how many reader threads to use, False or 1 falls back to the plain loop
+    if parallel is True:
+        workers = min(len(file_paths), os.cpu_count())
+    else:
+        workers = int(parallel)
+
+    if workers > 1:
+        #submit one read per file and collect the dataframes as they complete
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_read_csv, base_dir+file_path, engine, use_cache, use_arrow_dtypes): file_path
+                       for file_path in file_paths}
+            for future in as_completed(futures):
+                csv_loaded[keys[futures[future]]] = future.result()
+    else:
+        for file_path in file_paths:
+            csv_loaded[keys[file_path]] = _read_csv(base_dir+file_path, engine, use_cache, use_arrow_dtypes)
+
+    #rename once after all reads complete, assigning the result back - .str.lower() on its
+    #own returns a new Index and does not modify the dataframe.
+    if lowercase_cols:
+        for df in csv_loaded.values():
+            df.columns = [column.lower() for column in df.columns]
 
-    return csv_loaded
\ No newline at end of file
+    return csv_loaded
@@ -1,32 +1,49 @@
 
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 from pyrosm import OSM
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 import networkx as nx
-import osmnx as ox
-from shapely.geometry import Point
+from scipy.spatial import Delaunay, cKDTree
+from shapely.geometry import MultiLineString, MultiPoint
+from shapely.ops import polygonize, unary_union
 import matplotlib.pyplot as plt
-import alphashape
 from faker import Faker
 import time
 from tqdm import tqdm
 import uuid
-import warnings
 
-def load_osm_network(file_path:str, network_type:str, graph_type:str):
+#numba is an optional accelerator - the alpha-shape filter falls back to numpy without it
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+#igraph is an optional accelerator - shortest path queries fall back to networkx without it
+try:
+    import igraph as ig
+except ImportError:
+    ig = None
+
+def load_osm_network(file_path:str, network_type:str, graph_type:str, return_nodes_edges:bool = True):
     """ Load an OSM file and extract the network (driving, walking etc) as a graph (e.g. networkx graph) along with its nodes and edges.
     G, nodes, edges = load_osm_network(args) to extract.
-    
-    Returns: 
+
+    Returns:
     --------
-    G (MultiDiGraph), nodes (gdf) and edges (gdf)
-    
+    G (MultiDiGraph), nodes (gdf) and edges (gdf); just G when return_nodes_edges is False.
+
     Parameters:
     -----------
     - file_path (str): File path of OSM road data, a .pbf file.
     - network_type (str): Type of transport, e.g. driving, walking, cycling.
     - graph_type: Type of graph to create, available types: networkx, pandana, igraph. Likely choose networkx for use with rest of the methods.
-    
+    - return_nodes_edges (bool): If False, returns only the graph and releases the node/edge
+      GeoDataFrames once the graph is built, lowering peak memory on large .pbf files.
+
     Example:
     ---------
     
@@ -41,7 +58,19 @@ def load_osm_network(file_path:str, network_type:str, graph_type:str):
     osm = OSM(file_path)
     nodes, edges = osm.get_network(network_type=network_type, nodes=True)
     G = osm.to_graph(nodes, edges, graph_type=graph_type)
-    
+
+    #pre-build the cached coordinate arrays so the hot functions gather node x/y by
+    #integer index from the start, rather than each paying the dict-of-dicts walk once.
+    if graph_type == 'networkx':
+        _node_coord_arrays(G)
+
+    #pyrosm's to_graph needs the node/edge GeoDataFrames, so the double pass over the edge
+    #table cannot be skipped - but callers that only want G can at least have both tables
+    #freed here instead of keeping a second copy of the network alive.
+    if not return_nodes_edges:
+        del nodes, edges
+        return G
+
     return G, nodes, edges
 
 def csv_to_gdf(csv, x_col:str, y_col:str, input_crs:int, crs_conversion:int = None):
@@ -69,29 +98,137 @@ def csv_to_gdf(csv, x_col:str, y_col:str, input_crs:int, crs_conversion:int = No
     >>> name     X      Y            geometry
     >>> charlie  331131 376131 POINT (-5.97089 54.61635)
     """
-    #create a list for each row of geom by zipping and turn into a point tuple
+    #build all point geoms in one vectorised GEOS call rather than one Point object per row
     try:
-        csv['geometry'] = list(zip(csv[x_col], csv[y_col]))
-        csv['geometry'] = csv['geometry'].apply(Point)
+        geometry = gpd.points_from_xy(csv[x_col].to_numpy(dtype='float64', copy=False),
+                                      csv[y_col].to_numpy(dtype='float64', copy=False))
         # Convert to GeoDataFrame
-        gdf = gpd.GeoDataFrame(csv, geometry='geometry', crs=f'EPSG:{input_crs}')
+        gdf = gpd.GeoDataFrame(csv, geometry=geometry, crs=f'EPSG:{input_crs}')
         #Only converts if specified
         if crs_conversion:
             gdf = gdf.to_crs(epsg=crs_conversion)
             
-        #adds a uuid - useful to avoid duplicates.
-        uuid_list = []
-        for i in range(len(gdf)):
-            new_uuid = uuid.uuid4()
-            uuid_list.append(new_uuid)
-        gdf['uuid'] = uuid_list
+        #adds a uuid - useful to avoid duplicates. One urandom call supplies the randomness
+        #for every row, much faster than calling uuid.uuid4() row by row.
+        raw = os.urandom(16 * len(gdf))
+        gdf['uuid'] = [uuid.UUID(bytes=raw[i:i + 16], version=4) for i in range(0, len(raw), 16)]
         
         return gdf
     except Exception:
         print(f'Exception error: {Exception}')
         
         
-def nearest_node_and_name(graph, locations: gpd.GeoDataFrame, location_name: str = None, 
+def _filter_triangles_numpy(points, simplices, max_circumradius):
+    """ Boolean mask of Delaunay triangles whose circumradius is below the alpha cutoff,
+    computed across all triangles at once with Heron's formula."""
+    point_a = points[simplices[:, 0]]
+    point_b = points[simplices[:, 1]]
+    point_c = points[simplices[:, 2]]
+    side_a = np.hypot(point_a[:, 0] - point_b[:, 0], point_a[:, 1] - point_b[:, 1])
+    side_b = np.hypot(point_b[:, 0] - point_c[:, 0], point_b[:, 1] - point_c[:, 1])
+    side_c = np.hypot(point_c[:, 0] - point_a[:, 0], point_c[:, 1] - point_a[:, 1])
+    semiperimeter = (side_a + side_b + side_c) / 2.0
+    areas = np.sqrt(np.maximum(semiperimeter * (semiperimeter - side_a)
+                               * (semiperimeter - side_b) * (semiperimeter - side_c), 0.0))
+    #degenerate (zero area) triangles get an infinite circumradius and are filtered out
+    with np.errstate(divide='ignore', invalid='ignore'):
+        circumradius = (side_a * side_b * side_c) / (4.0 * areas)
+    return circumradius < max_circumradius
+
+
+if njit is not None:
+    #numba-compiled variant of the kernel above: same maths, but a tight parallel loop
+    #over simplices that SIMD-vectorises instead of allocating intermediate arrays
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _filter_triangles(points, simplices, max_circumradius):
+        triangle_count = simplices.shape[0]
+        keep = np.empty(triangle_count, np.bool_)
+        for i in prange(triangle_count):
+            ax, ay = points[simplices[i, 0], 0], points[simplices[i, 0], 1]
+            bx, by = points[simplices[i, 1], 0], points[simplices[i, 1], 1]
+            cx, cy = points[simplices[i, 2], 0], points[simplices[i, 2], 1]
+            side_a = np.sqrt((ax - bx) ** 2 + (ay - by) ** 2)
+            side_b = np.sqrt((bx - cx) ** 2 + (by - cy) ** 2)
+            side_c = np.sqrt((cx - ax) ** 2 + (cy - ay) ** 2)
+            semiperimeter = (side_a + side_b + side_c) / 2.0
+            area_sq = (semiperimeter * (semiperimeter - side_a)
+                       * (semiperimeter - side_b) * (semiperimeter - side_c))
+            if area_sq <= 0.0:
+                keep[i] = False
+            else:
+                keep[i] = side_a * side_b * side_c / (4.0 * np.sqrt(area_sq)) < max_circumradius
+        return keep
+else:
+    _filter_triangles = _filter_triangles_numpy
+
+
+def _alpha_shape(points, alpha_value):
+    """ Alpha shape of an (n, 2) coordinate array. Same result as alphashape.alphashape but
+    built directly from a scipy Delaunay triangulation: triangles whose circumradius exceeds
+    1/alpha are filtered out (numba-compiled when available) and the remainder polygonised
+    at the GEOS level, which is far faster than the pure-Python library for large point sets."""
+    points = np.asarray(points, dtype='float64')
+    #too few points to triangulate, the convex hull (point/line/triangle) is the best shape
+    if len(points) < 4:
+        return MultiPoint(points).convex_hull
+
+    triangulation = Delaunay(points)
+    simplices = triangulation.simplices
+    kept = simplices[_filter_triangles(points, simplices, 1.0 / alpha_value)]
+
+    #boundary edges belong to exactly one kept triangle; interior edges appear twice
+    edges = np.concatenate([kept[:, [0, 1]], kept[:, [1, 2]], kept[:, [2, 0]]])
+    edges.sort(axis=1)
+    unique_edges, edge_counts = np.unique(edges, axis=0, return_counts=True)
+    boundary_edges = unique_edges[edge_counts == 1]
+
+    return unary_union(list(polygonize(MultiLineString(points[boundary_edges].tolist()))))
+
+
+def _node_coord_arrays(graph):
+    """ Parallel numpy arrays of node coordinates plus a node id -> array position mapping,
+    built once per graph and cached on it. Hot loops can then gather coordinates with a
+    single integer-index operation instead of a dict-of-dicts lookup per node."""
+    if '_node_xy' not in graph.graph:
+        node_count = len(graph.nodes)
+        node_xs = np.fromiter((data['x'] for _, data in graph.nodes(data=True)), dtype='float64', count=node_count)
+        node_ys = np.fromiter((data['y'] for _, data in graph.nodes(data=True)), dtype='float64', count=node_count)
+        graph.graph['_node_xy'] = np.column_stack((node_xs, node_ys))
+        graph.graph['_node_id_to_idx'] = {node_id: index for index, node_id in enumerate(graph.nodes)}
+    return graph.graph['_node_xy'], graph.graph['_node_id_to_idx']
+
+
+def _igraph_nearest_dest_lengths(graph, dest_nodes):
+    """ Distance from every graph node to its closest destination node, computed in
+    igraph's C core. The converted igraph graph is built once and cached on the networkx
+    graph, so repeat queries against the same network only pay the C-level search."""
+    if '_igraph' not in graph.graph:
+        graph.graph['_igraph'] = ig.Graph.from_networkx(graph)
+    ig_graph = graph.graph['_igraph']
+
+    node_ids = ig_graph.vs['_nx_name']
+    dest_indices = [index for index, node_id in enumerate(node_ids) if node_id in dest_nodes]
+    #one matrix row of distances per destination; the column minimum is the nearest one
+    distances = np.asarray(ig_graph.distances(source=dest_indices, weights='length'))
+    nearest = distances.min(axis=0)
+    #matches the networkx dict output, where unreachable nodes are simply absent
+    return {node_id: dist for node_id, dist in zip(node_ids, nearest) if np.isfinite(dist)}
+
+
+def _nearest_nodes(graph, xs, ys):
+    """ Returns the nearest graph node id for each x/y query point. Builds a cKDTree over the
+    node coordinates on first use and caches it on the graph, so repeat lookups only pay the
+    (parallelised) query cost rather than rebuilding a spatial index every call."""
+    if '_node_tree' not in graph.graph:
+        node_xy, _ = _node_coord_arrays(graph)
+        graph.graph['_node_ids'] = np.fromiter(graph.nodes, dtype='int64', count=len(graph.nodes))
+        graph.graph['_node_tree'] = cKDTree(node_xy)
+
+    _, indices = graph.graph['_node_tree'].query(np.column_stack((xs, ys)), k=1, workers=-1)
+    return graph.graph['_node_ids'][indices]
+
+
+def nearest_node_and_name(graph, locations: gpd.GeoDataFrame, location_name: str = None,
                           anon_name: bool = False):
     """ Creates a dictionary of location names and nearest node on Graph. If no location name column specified, creates a list.
     Anonymised naming can be enabled by not inputting location_name and anon_name = True. This also forces a dictionary type if you only have point data.
@@ -134,27 +271,68 @@ def nearest_node_and_name(graph, locations: gpd.GeoDataFrame, location_name: str
         locations['Fake Name'] = fake_names
         location_name = 'Fake Name' 
         
-    # Calculate the nearest note for each location
-    for index, row in tqdm(locations.iterrows(), total=locations.shape[0], desc="Processing start locations"):
-        location_x = row['geometry'].x
-        location_y = row['geometry'].y
-        nearest_node = ox.distance.nearest_nodes(graph, location_x, location_y)
-        
-        # Add nearest node name to service_xy, no location name specified, location_{index} is the name
-        if location_name:
-            name = row[location_name]
-            service_xy[name] = {'nearest_node': nearest_node}        
-        else:
-            name = f"location_{index}"
-        
+    # Calculate the nearest node for all locations in one vectorised query against the
+    # cached node tree, rather than rebuilding a spatial index per row.
+    location_xs = locations.geometry.x.to_numpy()
+    location_ys = locations.geometry.y.to_numpy()
+    nearest_nodes = _nearest_nodes(graph, location_xs, location_ys)
+
+    # No location name specified, location_{index} is the name
+    if location_name:
+        names = locations[location_name]
+    else:
+        names = [f"location_{index}" for index in locations.index]
+
+    for name, nearest_node in zip(names, nearest_nodes):
         service_xy[name] = {'nearest_node': nearest_node}
 
     return service_xy
 
 
 
-def service_areas(nearest_node_dict:dict, graph, search_distances:list, alpha_value:int, weight:str, 
-                  save_output:bool = False):
+def _location_service_areas(graph, name, nearest_node, search_distances, alpha_value, weight):
+    """ Service area rows for a single start location: one dijkstra out to the largest
+    cutoff, then one alpha shape per distance band. Returns a list of row dicts for the
+    service_areas GeoDataFrame."""
+    node_xy, node_id_to_idx = _node_coord_arrays(graph)
+    #One dijkstra per start location out to the largest cutoff; nodes are then bucketed
+    #per distance band below rather than re-running the search for every cutoff.
+    max_distance = max(search_distances)
+    lengths = nx.single_source_dijkstra_path_length(graph, nearest_node, cutoff=max_distance, weight=weight)
+    length_node_ids = np.fromiter(lengths.keys(), dtype='int64', count=len(lengths))
+    length_values = np.fromiter(lengths.values(), dtype='float64', count=len(lengths))
+
+    rows = []
+    for distance in search_distances:
+        #All nodes which are reachable within the cutoff; gather their coordinates
+        #with one integer-index into the cached coordinate array.
+        reachable_nodes = length_node_ids[length_values <= distance]
+        indices = np.fromiter((node_id_to_idx[node] for node in reachable_nodes),
+                              dtype='int64', count=len(reachable_nodes))
+        node_coords = node_xy[indices]
+
+        #Create an alpha shape for each polygon and append to dataframe.
+        alpha_shape = _alpha_shape(node_coords, alpha_value)
+        rows.append({'name': name, 'distance': distance, 'geometry': alpha_shape})
+    return rows
+
+
+#Shared graph for service_areas worker processes, set once per worker by the initializer
+#so the graph is not re-pickled for every submitted location.
+_worker_graph = None
+
+
+def _init_service_area_worker(graph):
+    global _worker_graph
+    _worker_graph = graph
+
+
+def _worker_location_service_areas(name, nearest_node, search_distances, alpha_value, weight):
+    return _location_service_areas(_worker_graph, name, nearest_node, search_distances, alpha_value, weight)
+
+
+def service_areas(nearest_node_dict:dict, graph, search_distances:list, alpha_value:int, weight:str,
+                  save_output:bool = False, n_jobs:int = 1):
     """
     Generates a GeoDataFramecontaining polygons of service areas calculated using Dijkstra's shortest path algorithm within a networkx graph. 
     Each polygon represents a service area contour defined by a maximum distance from a source node.
@@ -172,7 +350,10 @@ def service_areas(nearest_node_dict:dict, graph, search_distances:list, alpha_va
         weight (str): The edge attribute in the graph to use as a weight, e.g. 'length', 'speed' etc.
         progress (bool): If True, will print progress of the function.
         save_output (bool): If True, will save output as `service_areas.gpkg` to root folder.
-    
+        n_jobs (int): Number of worker processes to spread the start locations over. Each
+            location is independent so this scales close to linearly; -1 uses all cores.
+            Defaults to 1 (no extra processes).
+
     Example:
     --------
     >>> node_dict = services.network_bands.nearest_node_and_name(...)
@@ -184,32 +365,34 @@ def service_areas(nearest_node_dict:dict, graph, search_distances:list, alpha_va
 
     data_for_gdf = []
 
-    print(f'Creating network service areas of sizes: {search_distances} metres')    
-    #For each start location [name] creates a polygon around the point.
-    for index, (name, node_info) in tqdm(enumerate(nearest_node_dict.items()), total=len(nearest_node_dict), desc='Processing nodes'):        
-        # print(f'Processing: location {index+1} of {len(nearest_node_dict)}: {name}. ')
-        #cycle through each distance in list supplied creating service areas for each
-        for distance in tqdm(search_distances, total=len(search_distances), desc=f'Processing: location {index+1} of {len(nearest_node_dict)}: {name} : '):
-            #Extract nearest node to the name (start location)
-            nearest_node = node_info['nearest_node']
-            subgraph = nx.single_source_dijkstra_path_length(graph, nearest_node, cutoff=distance, weight = weight)
-            
-            #Creates a list of all nodes which are reachable within the cutoff.
-            reachable_nodes = list(subgraph.keys())
-            node_points_list = []
-            for node in reachable_nodes:
-                x = graph.nodes[node]['x']
-                y = graph.nodes[node]['y']
-                node_points_list.append(Point(x, y))
-
-            # Makes the x,y values into just a list of tuples to be used to create alphashapes
-            node_point_series_tuples = (pd.Series(node_points_list)).apply(lambda point: (point.x, point.y))
-            node_point_tuple_list = node_point_series_tuples.tolist()
-            
-            #Create an alpha shape for each polygon and append to dataframe.
-            alpha_shape = alphashape.alphashape(node_point_tuple_list, alpha_value)
-            data_for_gdf.append({'name': name, 'distance':distance, 'geometry': alpha_shape})
-            # service_areas_dict[name] = alpha_shape #uncomment to check if function returns correct variables
+    print(f'Creating network service areas of sizes: {search_distances} metres')
+    if n_jobs == -1:
+        n_jobs = os.cpu_count()
+
+    #For each start location [name] creates a polygon around the point. One flat progress
+    #bar counts finished service areas; mininterval throttles the terminal writes so the
+    #bar itself stays a negligible cost on fast iterations.
+    progress = tqdm(total=len(nearest_node_dict) * len(search_distances),
+                    desc='Creating service areas', mininterval=0.5)
+    if n_jobs > 1:
+        #Every start location is independent, so fan them out over worker processes. The
+        #graph is shipped once per worker via the initializer rather than once per task.
+        with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_service_area_worker,
+                                 initargs=(graph,)) as executor:
+            futures = [executor.submit(_worker_location_service_areas, name, node_info['nearest_node'],
+                                       search_distances, alpha_value, weight)
+                       for name, node_info in nearest_node_dict.items()]
+            for future in as_completed(futures):
+                data_for_gdf.extend(future.result())
+                progress.update(len(search_distances))
+    else:
+        #warm the coordinate cache once, outside the per-location helper
+        _node_coord_arrays(graph)
+        for name, node_info in nearest_node_dict.items():
+            data_for_gdf.extend(_location_service_areas(graph, name, node_info['nearest_node'],
+                                                        search_distances, alpha_value, weight))
+            progress.update(len(search_distances))
+    progress.close()
 
     gdf_alpha = gpd.GeoDataFrame(data_for_gdf, crs= 4326)
     
@@ -247,34 +430,19 @@ def service_bands(geodataframe:gpd.GeoDataFrame, dissolve_cat:str, aggfunc:str =
     
         """
         
-        #Smallest first, e.g. 1000, then 2000, then 3000
-    data_for_gdf = []
-    differenced_geoms = []
-    category_values = []
-    #Subset dataframe by dissolve category then run dissolve, dissolving and then subsetting creates invalid geoms.
-    search_distances = geodataframe[dissolve_cat].unique()
-    for distance in search_distances:
-        filtered_data = geodataframe[geodataframe[dissolve_cat] == distance].reset_index(drop=True)
-        filtered_data_dissolved = filtered_data.dissolve(aggfunc=aggfunc)
-        data_for_gdf.append(filtered_data_dissolved)
-    #Create gdf for each dissolved category
-    gdf_dissolve = gpd.GeoDataFrame(pd.concat(data_for_gdf, ignore_index=True), crs='EPSG:4326')
-    
-    #sort data so that the smallest area which cannot be differenced is exluded.
-    #iterates so that the larger area which is a lower indexis differenced by the geom above it.
-    #note to self: next step to make it work without dissolving prior.
-    gdf_dissolve_sorted = gdf_dissolve.sort_values(by=dissolve_cat, ascending=False)
-    for index in range(0,len(gdf_dissolve_sorted)-1):
-        differenced_part = gdf_dissolve_sorted.geometry.iloc[index].difference(gdf_dissolve_sorted.geometry.iloc[index+1])
-        differenced_geoms.append(differenced_part)
-        category_values.append(gdf_dissolve_sorted.iloc[index][dissolve_cat])
-
-    #append the smallest geom as this is excluded from the dissolve difference loop.
-    final_index = (len(gdf_dissolve_sorted)-1)
-    differenced_geoms.append(gdf_dissolve_sorted.iloc[final_index]['geometry'])
-    category_values.append(gdf_dissolve_sorted.iloc[final_index][dissolve_cat])
+    #Dissolve every band at once with a single groupby-dissolve, sorted largest first,
+    #e.g. 3000, then 2000, then 1000.
+    gdf_dissolve_sorted = (geodataframe.dissolve(by=dissolve_cat, aggfunc=aggfunc)
+                           .sort_index(ascending=False).reset_index())
+
+    #cut each band by the next smaller one in a single vectorised difference against the
+    #shifted geometry column; the smallest band has nothing below it and keeps its geometry.
+    geoms = gdf_dissolve_sorted.geometry
+    differenced_geoms = pd.concat([geoms.iloc[:-1].difference(geoms.shift(-1).iloc[:-1], align=False),
+                                   geoms.iloc[[-1]]])
     #append geometry to geodataframe to return as final result
-    differenced_gdf = gpd.GeoDataFrame({'geometry': differenced_geoms, dissolve_cat: category_values}, crs=geodataframe.crs)
+    differenced_gdf = gpd.GeoDataFrame({'geometry': differenced_geoms,
+                                        dissolve_cat: gdf_dissolve_sorted[dissolve_cat]}, crs=geodataframe.crs)
     print('Network areas have successfully been dissolved and differenced')
     #produces a quick and ready map for instant analysis.
     if show_graph:
@@ -294,11 +462,12 @@ def service_bands(geodataframe:gpd.GeoDataFrame, dissolve_cat:str, aggfunc:str =
 
 
 def shortest_path_iterator(start_locations:gpd.GeoDataFrame, destination_locations:gpd.GeoDataFrame, networkx_graph):
-    """ Shortest distance to destination using dijkstra's algorithm. The function iterates over destination for 
-    each start location, returning a dataframe with the closest destination. 
-    
-    WARNING - TAKES A VERY LONG TIME - advised to not use!
-    
+    """ Shortest distance to destination using dijkstra's algorithm. A single multi-source
+    search seeded from every destination labels each graph node with the distance to its
+    closest destination, so each start location only needs a lookup afterwards. Returns a
+    dataframe with the distance to the closest destination. Start locations that cannot
+    reach any destination get a distance of infinity.
+
     Paramters:
         start_locations (GeoDataFrame): geopandas DataFrame of start locations such as houses.
         destination_dataset (GeoDatFrame): geopandas DataFrame of end locations such as hospitals or supermarkets.
@@ -309,42 +478,35 @@ def shortest_path_iterator(start_locations:gpd.GeoDataFrame, destination_locatio
     
     >>> shortest_path_iterator(start_locations = house_data, destination_locations = hospitals, networkx_graph = G)
     """
-    #warning.
-    
-    if len(start_locations) >= 100 or len(destination_locations) >= 100:
-        warnings.warn('Your dataset is quite large, this may take an incredibly long time to process. ' 
-            'Consider using the service_areas function instead for more efficient computation.',
-            UserWarning)
-    else:
-        warnings.warn("Iterating over large datasets takes a very long time. To stop the process, interrupt with a keyboard command such as Ctrl+C.",
-            UserWarning)
-    
-    #Preload the nearest nodes to destination to reduce insane run times using nearest_node_and_name function into a nameless dict
+    #Preload the nearest nodes to destination using nearest_node_and_name function into a nameless dict
     print(f'Calculating the nearest node on the network graph for each start location')
     dest_node_ids = nearest_node_and_name(graph= networkx_graph, locations=destination_locations)
-    
-    start_locations['shortest_dist_to_dest'] = float('inf')
-    #iterate over each house, then library.
 
-    for index, row in tqdm(start_locations.iterrows(), total=len(start_locations), desc=f"Calculating and identifying the shortest path between each start location and the nearest of the destination locations"):
-        orig_x = row['geometry'].x
-        orig_y = row['geometry'].y       
-        orig_node_id = ox.distance.nearest_nodes(networkx_graph, orig_x, orig_y)
-        
-
-        # iterate over destination node id dictionary for shortest distance out of all desitnations
-        shortest_distance = float('inf')
+    #One multi-source dijkstra seeded from every destination node labels each node in the
+    #graph with the distance to its closest destination - a single search instead of one
+    #dijkstra per (start, destination) pair. Distances must run destination -> start, so
+    #seed the reversed graph when the graph is directed.
+    dest_nodes = {dest_info['nearest_node'] for dest_info in dest_node_ids.values()}
+    search_graph = networkx_graph.reverse(copy=False) if networkx_graph.is_directed() else networkx_graph
+    #igraph's C core answers the search orders of magnitude faster than networkx's
+    #pure-Python dijkstra; networkx remains the fallback when igraph is not installed.
+    if ig is not None:
+        dist_to_nearest_dest = _igraph_nearest_dest_lengths(search_graph, dest_nodes)
+    else:
+        dist_to_nearest_dest = nx.multi_source_dijkstra_path_length(search_graph, dest_nodes, weight='length')
 
-        for dest_name, dest_info in dest_node_ids.items():
-            dest_node_id = dest_info['nearest_node']  # gets the node ID
+    #column-at-a-time coordinate access and one batched nearest-node query for every start
+    #location, instead of materialising a Series per row with iterrows
+    orig_xs = start_locations.geometry.x.to_numpy()
+    orig_ys = start_locations.geometry.y.to_numpy()
+    orig_node_ids = _nearest_nodes(networkx_graph, orig_xs, orig_ys)
 
-            path_length = nx.shortest_path_length(networkx_graph, source=orig_node_id, target=dest_node_id, weight='length')
-            if path_length < shortest_distance:
-                shortest_distance = path_length
+    #assign the whole column at once rather than pre-filling it with inf and overwriting
+    #row by row with .at - unreachable start locations still come out as infinity.
+    #float32 is ample precision for metre distances and halves the column's memory.
+    start_locations['shortest_dist_to_dest'] = np.array(
+        [dist_to_nearest_dest.get(node_id, float('inf')) for node_id in orig_node_ids], dtype='float32')
 
-        # Updates the shortest distance in the gdf
-        start_locations.at[index, 'shortest_dist_to_dest'] = shortest_distance
-        
     return start_locations
         
         